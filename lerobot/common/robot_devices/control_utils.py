@@ -17,6 +17,7 @@
 ########################################################################################
 
 
+import inspect
 import logging
 import time
 import traceback
@@ -38,6 +39,14 @@ from lerobot.common.robot_devices.utils import busy_wait
 from lerobot.common.utils.utils import get_safe_torch_device, has_method
 
 
+def accepts_as_torch(robot: Robot) -> bool:
+    """Return whether `robot.teleop_step` and `robot.capture_observation` accept the `as_torch` argument."""
+    return all(
+        "as_torch" in inspect.signature(getattr(robot, method)).parameters
+        for method in ("teleop_step", "capture_observation")
+    )
+
+
 def log_control_info(robot: Robot, dt_s, episode_index=None, frame_index=None, fps=None):
     log_items = []
     if episode_index is not None:
@@ -245,6 +254,12 @@ def control_loop(
     if dataset is not None and fps is not None and dataset.fps != fps:
         raise ValueError(f"The dataset fps should be equal to requested fps ({dataset['fps']} != {fps}).")
 
+    # Tactile observations only written to the dataset are kept as numpy arrays, since it stores them as such.
+    # Only robots whose observation methods accept `as_torch` support it.
+    obs_kwargs = {}
+    if policy is None and not display_data and accepts_as_torch(robot):
+        obs_kwargs["as_torch"] = False
+
     timestamp = 0
     start_episode_t = time.perf_counter()
 
@@ -256,9 +271,9 @@ def control_loop(
         start_loop_t = time.perf_counter()
 
         if teleoperate:
-            observation, action = robot.teleop_step(record_data=True)
+            observation, action = robot.teleop_step(record_data=True, **obs_kwargs)
         else:
-            observation = robot.capture_observation()
+            observation = robot.capture_observation(**obs_kwargs)
             action = None
 
             if policy is not None:
@@ -62,6 +62,26 @@ class ManipulatorRobotConfig(RobotConfig):
     # gripper is not put in torque mode.
     gripper_open_degree: float | None = None
 
+    # Optionally read and format the tactile sensors continuously in background threads. Observations then
+    # use the latest formatted frame of each sensor instead of reading the sensors in the control loop.
+    tactile_streaming: bool = False
+
+    # Install SIGINT/SIGTERM handlers and an exit hook disconnecting the robot. They are only installed when
+    # the robot is created from the main thread.
+    install_signal_handlers: bool = True
+
+    # Record the duration of the tactile reads in `logs`, and log a summary of them on disconnect.
+    profile: bool = False
+
+    # Optionally pin the thread calling `connect` (the control loop) to this CPU, and the tactile and observation
+    # reading threads to the other available CPUs (Linux only). Threads later started from the control loop
+    # inherit its CPU. The original CPU affinity is restored on `disconnect`.
+    control_loop_cpu: int | None = None
+
+    # Allocate the state and action vectors, and copy the camera and tactile observations, in pinned memory to
+    # speed up their copy to the GPU. Ignored when CUDA is not available.
+    pin_memory: bool = False
+
     mock: bool = False
 
     def __post_init__(self):
@@ -0,0 +1,47 @@
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compiled kernels of the numeric work done by the robots at every step of the control loop."""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def clamp_goal_position(
+    goal_pos: np.ndarray, present_pos: np.ndarray, max_relative_target: np.ndarray
+) -> tuple[np.ndarray, bool]:
+    """Cap the distance between the goal and present positions of each motor to `max_relative_target`.
+
+    Returns the safe goal position, and whether any motor had to be clamped.
+    """
+    safe_goal_pos = np.empty_like(goal_pos)
+    clamped = False
+    for i in range(goal_pos.shape[0]):
+        diff = goal_pos[i] - present_pos[i]
+        if diff > max_relative_target[i]:
+            diff = max_relative_target[i]
+            clamped = True
+        elif diff < -max_relative_target[i]:
+            diff = -max_relative_target[i]
+            clamped = True
+        safe_goal_pos[i] = present_pos[i] + diff
+    return safe_goal_pos, clamped
+
+
+# Compile the kernel for the contiguous and writable float32 arrays of the motors buses and of
+# `max_relative_target_array` at import time, instead of during the first step of the control loop.
+# Numba compiles a new specialization for other layouts, e.g. read-only views. Thanks to `cache=True`,
+# this is only slow the first time.
+_warmup_pos = np.zeros(1, dtype=np.float32)
+clamp_goal_position(_warmup_pos, _warmup_pos, np.ones(1, dtype=np.float32))
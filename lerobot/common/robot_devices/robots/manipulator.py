@@ -18,14 +18,22 @@ and send orders to its motors.
 # TODO(rcadene, aliberts): reorganize the codebase into one file per robot, with the associated
 # calibration procedure, to make it easy for people to add their own robot.
 
+import itertools
 import json
 import logging
+import os
+import re
 import time
 import warnings
 import signal
 import atexit
+import threading
+import weakref
+from collections import deque
+from functools import cached_property, partial
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 import numpy as np
 import torch
@@ -35,23 +43,219 @@ from lerobot.common.robot_devices.cameras.utils import Camera, make_cameras_from
 from lerobot.common.robot_devices.motors.configs import MotorsBusConfig
 from lerobot.common.robot_devices.motors.utils import MotorsBus, make_motors_buses_from_configs
 from lerobot.common.robot_devices.tactile_sensors.configs import TactileSensorConfig
-from lerobot.common.robot_devices.tactile_sensors.utils import TactileSensor, make_tactile_sensors_from_configs
+from lerobot.common.robot_devices.tactile_sensors.utils import (
+    TactileSensor,
+    TactileStreamer,
+    make_tactile_sensors_from_configs,
+)
 from lerobot.common.robot_devices.robots.configs import ManipulatorRobotConfig
+from lerobot.common.robot_devices.robots.kernels import clamp_goal_position
 from lerobot.common.robot_devices.robots.utils import get_arm_id
 from lerobot.common.robot_devices.utils import RobotDeviceAlreadyConnectedError, RobotDeviceNotConnectedError
 
+# Features of the tactile sensors by field, shared by all the sensors of the same type.
+_TACTILE_METADATA_FEATURES = {
+    "sensor_sn": {"dtype": "string", "shape": (1,), "names": None},
+    "frame_index": {"dtype": "int64", "shape": (1,), "names": None},
+    "send_timestamp": {"dtype": "float64", "shape": (1,), "names": None},
+    "recv_timestamp": {"dtype": "float64", "shape": (1,), "names": None},
+}
+# 合成力和力矩 (3D向量)
+_TACTILE_FORCE_FEATURES = {
+    "resultant_force": {"dtype": "float64", "shape": (3,), "names": ["x", "y", "z"]},
+    "resultant_moment": {"dtype": "float64", "shape": (3,), "names": ["x", "y", "z"]},
+}
+_TACTILE_IMAGE_NAMES = ["height", "width", "channel"]
+_TACTILE_FEATURES_TEMPLATES = {
+    # Tac3D传感器特有的三维数据阵列 (400个标志点，每个3维坐标)
+    "tac3d": {
+        **_TACTILE_METADATA_FEATURES,
+        "positions_3d": {"dtype": "float64", "shape": (400, 3), "names": ["marker_id", "coordinate"]},
+        "displacements_3d": {"dtype": "float64", "shape": (400, 3), "names": ["marker_id", "coordinate"]},
+        "forces_3d": {"dtype": "float64", "shape": (400, 3), "names": ["marker_id", "coordinate"]},
+        **_TACTILE_FORCE_FEATURES,
+    },
+    # DIGIT传感器：只处理图像数据
+    "digit": {
+        **_TACTILE_METADATA_FEATURES,
+        "tactile_image": {"dtype": "uint8", "shape": (240, 320, 3), "names": _TACTILE_IMAGE_NAMES},
+    },
+}
+# 未知传感器类型，使用基本的力数据格式
+_UNKNOWN_TACTILE_FEATURES = {**_TACTILE_METADATA_FEATURES, **_TACTILE_FORCE_FEATURES}
+
+# Default values of the tactile observations when a sensor has no data. They are shared by all the frames
+# instead of being allocated on each of them, and thus must not be modified in place.
+_ZERO_400X3_F64 = np.zeros((400, 3), dtype=np.float64)
+_ZERO_3_F64 = np.zeros(3, dtype=np.float64)
+_ZERO_1_F64 = np.zeros(1, dtype=np.float64)
+_ZERO_1_I64 = np.zeros(1, dtype=np.int64)
+
+
+def _as_float64(array: np.ndarray) -> np.ndarray:
+    """Return `array` as an aligned, C-contiguous and writable float64 array.
+
+    The array is only copied when it does not already have this dtype and layout, in which case the cast and
+    the copy are done at once. The arrays of PyTac3D are built from the received bytes and are read-only, so
+    they are always copied, as `torch.from_numpy` does not support read-only arrays.
+    """
+    return np.require(array, dtype=np.float64, requirements=["C", "A", "W"])
+
+
+# Fields of the Tac3D frames holding an array of one 3D vector per marker
+_TAC3D_ARRAY_FIELDS = ("3D_Positions", "3D_Displacements", "3D_Forces")
+
+
+def _tac3d_arrays(data: dict) -> list[np.ndarray]:
+    """Return the positions, displacements and forces of a Tac3D frame as float64 arrays, or zeros when missing.
+
+    Arrays that are already float64, aligned, C-contiguous and writable are used as is. Otherwise, e.g. for the
+    read-only arrays of PyTac3D, the arrays are copied into a single (3, N, 3) block allocated for this frame, and
+    views of this block are returned.
+    """
+    arrays = [data.get(field) for field in _TAC3D_ARRAY_FIELDS]
+    if any(array is None for array in arrays):
+        return [_as_float64(array) if array is not None else _ZERO_400X3_F64 for array in arrays]
+
+    if all(
+        isinstance(array, np.ndarray)
+        and array.dtype == np.float64
+        and array.flags["C_CONTIGUOUS"]
+        and array.flags["ALIGNED"]
+        and array.flags["WRITEABLE"]
+        for array in arrays
+    ):
+        return arrays
+
+    shape = np.shape(arrays[0])
+    if any(np.shape(array) != shape for array in arrays[1:]):
+        return [_as_float64(array) for array in arrays]
+
+    block = np.empty((len(arrays), *shape), dtype=np.float64)
+    for dst, src in zip(block, arrays, strict=True):
+        np.copyto(dst, src)
+    return list(block)
+
+
+def _force3(value) -> np.ndarray:
+    """Return the first 3 components of a resultant force/moment as a float64 array, or zeros when missing."""
+    array = np.asarray(value, dtype=np.float64) if value is not None else _ZERO_3_F64
+    if array.size < 3:
+        return _ZERO_3_F64
+    return array.reshape(-1)[:3].copy()
+
+
+# Minimum interval between two identical warnings of the control loop, so that a sensor failing on every frame
+# does not flood the console.
+_WARNING_INTERVAL_S = 1.0
+
+
+def _disconnect_device(device: str, instance):
+    """Disconnect a device after another one failed to connect, logging instead of raising any error."""
+    try:
+        instance.disconnect()
+    except Exception as e:
+        logging.warning(f"Failed to disconnect {device}: {e}")
+
+
+def _disconnect_if_connected(device: str, instance, future: Future):
+    """Done callback disconnecting a device whose concurrent connection succeeded."""
+    if not future.cancelled() and future.exception() is None:
+        _disconnect_device(device, instance)
+
+
+def _find_ffmpeg_video_pids() -> list[int]:
+    """Return the pids of the processes whose command line matches `ffmpeg.*video`, like `pgrep -f`."""
+    try:
+        import psutil
+    except ImportError:
+        # psutil is optional, fallback to pgrep
+        import subprocess
+
+        result = subprocess.run(["pgrep", "-f", "ffmpeg.*video"], capture_output=True, text=True, timeout=2.0)
+        return [int(pid) for pid in result.stdout.split()] if result.returncode == 0 else []
+
+    pattern = re.compile("ffmpeg.*video")
+    pids = []
+    for process in psutil.process_iter(["cmdline"]):
+        cmdline = process.info["cmdline"]
+        if process.pid != os.getpid() and cmdline and pattern.search(" ".join(cmdline)):
+            pids.append(process.pid)
+    return pids
+
+
+def _kill_ffmpeg_video_processes():
+    """Kill the ffmpeg processes left behind by GelSight sensors which failed to disconnect."""
+    for pid in _find_ffmpeg_video_pids():
+        try:
+            os.kill(pid, signal.SIGKILL)
+            print(f"强制终止ffmpeg进程 {pid}")
+        except OSError:
+            pass
+
+
+# Robots to clean up at exit. A single exit hook is registered for all of them, and robots are not kept
+# alive by it.
+_REGISTERED_ROBOTS: "weakref.WeakSet[ManipulatorRobot]" = weakref.WeakSet()
+_ATEXIT_INSTALLED = False
+
+
+def _cleanup_all():
+    """Cleanup function called at program exit, disconnecting all the robots still connected."""
+    for robot in list(_REGISTERED_ROBOTS):
+        robot._cleanup_at_exit()
+
+
+def _make_cpu_pinning_initializer(cpus: list[int]):
+    """Return a thread initializer pinning each thread running it to a distinct CPU of `cpus`, in turn."""
+    worker_ids = itertools.count()
+
+    def pin_worker():
+        os.sched_setaffinity(0, {cpus[next(worker_ids) % len(cpus)]})
+
+    return pin_worker
+
+
+def _register_robot(robot: "ManipulatorRobot"):
+    global _ATEXIT_INSTALLED
+    _REGISTERED_ROBOTS.add(robot)
+    if not _ATEXIT_INSTALLED:
+        atexit.register(_cleanup_all)
+        _ATEXIT_INSTALLED = True
+
+
+def max_relative_target_array(
+    max_relative_target: float | list[float], num_motors: int, dtype: np.dtype = np.float32
+) -> np.ndarray:
+    """Return `max_relative_target` as a new contiguous array of one value per motor.
+
+    This is the layout of the positions read from the motors, for which `clamp_goal_position` is compiled.
+    """
+    return np.array(np.broadcast_to(np.asarray(max_relative_target, dtype=dtype), (num_motors,)))
+
+
+def ensure_safe_goal_position_np(
+    goal_pos: np.ndarray, present_pos: np.ndarray, max_relative_target: float | list[float] | np.ndarray
+) -> np.ndarray:
+    """Cap the distance between the goal and present positions of each motor to `max_relative_target`.
+
+    Works on the numpy arrays read from and written to the motors. `max_relative_target` is best given as built
+    by `max_relative_target_array`, to avoid converting it on each call.
+    """
+    if not (
+        isinstance(max_relative_target, np.ndarray)
+        and max_relative_target.dtype == goal_pos.dtype
+        and max_relative_target.shape == goal_pos.shape
+    ):
+        max_relative_target = max_relative_target_array(max_relative_target, len(goal_pos), goal_pos.dtype)
 
-def ensure_safe_goal_position(
-    goal_pos: torch.Tensor, present_pos: torch.Tensor, max_relative_target: float | list[float]
-):
     # Cap relative action target magnitude for safety.
-    diff = goal_pos - present_pos
-    max_relative_target = torch.tensor(max_relative_target)
-    safe_diff = torch.minimum(diff, max_relative_target)
-    safe_diff = torch.maximum(safe_diff, -max_relative_target)
-    safe_goal_pos = present_pos + safe_diff
+    safe_goal_pos, clamped = clamp_goal_position(goal_pos, present_pos, max_relative_target)
 
-    if not torch.allclose(goal_pos, safe_goal_pos):
+    # Only format the (costly) warning message when a target was actually clamped.
+    if clamped:
+        diff = goal_pos - present_pos
+        safe_diff = safe_goal_pos - present_pos
         logging.warning(
             "Relative goal position magnitude had to be clamped to be safe.\n"
             f"  requested relative goal position target: {diff}\n"
@@ -61,6 +265,16 @@ def ensure_safe_goal_position(
     return safe_goal_pos
 
 
+def ensure_safe_goal_position(
+    goal_pos: torch.Tensor, present_pos: torch.Tensor, max_relative_target: float | list[float]
+) -> torch.Tensor:
+    """Same as `ensure_safe_goal_position_np`, on tensors."""
+    safe_goal_pos = ensure_safe_goal_position_np(
+        goal_pos.numpy(force=True), present_pos.numpy(force=True), max_relative_target
+    )
+    return torch.from_numpy(safe_goal_pos).to(goal_pos.device)
+
+
 class ManipulatorRobot:
     # TODO(rcadene): Implement force feedback
     """This class allows to control any manipulator robot of various number of motors.
@@ -174,15 +388,91 @@ class ManipulatorRobot:
         self.cameras = make_cameras_from_configs(config.cameras)
         self.tactile_sensors = self._make_tactile_sensors_from_configs(config.tactile_sensors)
 
+        # The motors of each bus are fixed once it is created.
+        self._leader_motor_names = self.get_motor_names(self.leader_arms)
+
+        # Type of each tactile sensor, and (H, W) of the GelSight/DIGIT images declared by their configuration.
+        # They are needed by `tactile_features` before connecting, and never change.
+        self._tactile_types = {
+            name: getattr(sensor.config, "type", "unknown") for name, sensor in self.tactile_sensors.items()
+        }
+        self._tactile_image_sizes = {}
+        for name, sensor in self.tactile_sensors.items():
+            if self._tactile_types[name] == "gelsight":
+                # GelSight传感器的图像尺寸取决于其配置
+                self._tactile_image_sizes[name] = (
+                    getattr(sensor.config, "imgh", 240),
+                    getattr(sensor.config, "imgw", 320),
+                )
+            elif self._tactile_types[name] == "digit":
+                self._tactile_image_sizes[name] = (240, 320)
+
+        # Observation keys are static, format them once instead of on every frame.
+        self._camera_keys = {name: f"observation.images.{name}" for name in self.cameras}
+        self._tactile_keys = {
+            name: self._make_tactile_keys(name, self._tactile_types[name]) for name in self.tactile_sensors
+        }
+
         self.is_connected = False
         self.logs = {}
+
+        # Persistent worker pool used to read the tactile sensors in parallel, created in `connect`.
+        self._tactile_pool = None
+        # Persistent worker pool reading the followers and cameras while the tactile sensors are read.
+        self._io_pool = None
+        # Background reader used instead of the pool when `config.tactile_streaming` is set.
+        self._tactile_streamer = None
+        # Per-sensor functions formatting a frame, specialized on the sensor type in `connect`.
+        self._tactile_handlers = {}
+        # (name, has_critical_error, get_error_status) of the sensors reporting critical errors, probed in
+        # `connect`. `get_error_status` is None when not supported.
+        self._tactile_error_checks = []
+        # Expected (H, W, 3) shape of the image based sensors and their shared blank fallback image,
+        # both locked in once in `connect`.
+        self._tactile_image_shapes = {}
+        self._tactile_empty_images = {}
+        # Observation entries of each sensor when it has no data, built once in `connect`. Their values are
+        # shared read-only defaults.
+        self._tactile_default_obs = {}
+
+        # Durations of the parallel tactile reads, only recorded when `config.profile` is set and
+        # summarized on `disconnect`.
+        self._profile = config.profile
+        self._tactile_read_dt_s = deque(maxlen=1024)
+
+        # Time at which each rate-limited warning was last logged
+        self._last_warning_t = {}
+
+        # Keys of the read/write durations in `self.logs`, built in `connect`. The durations are only measured
+        # and logged every `LEROBOT_LOG_EVERY` steps, which saves their bookkeeping on the other steps.
+        self._log_keys = {}
+        self._log_every = max(1, int(os.getenv("LEROBOT_LOG_EVERY", "1")))
+        self._log_step = 0
+        self._log_this_step = True
+
+        # Slice of each follower arm in the state and action vectors, and whether to allocate them in pinned
+        # memory, set in `connect`.
+        self._follower_slices = {}
+        self._state_dim = 0
+        self._pin_memory = False
+        # Name of the follower arm when there is only one, whose positions are then used as is.
+        self._only_follower = None
+        # `config.max_relative_target` of each follower arm as one value per motor, set in `connect`.
+        self._max_relative_targets = {}
+        # CPU affinity of the thread calling `connect` before it was pinned to `config.control_loop_cpu`,
+        # restored on `disconnect`.
+        self._original_cpu_affinity = None
         
-        # Register signal handlers for graceful shutdown
-        self._original_sigint_handler = signal.signal(signal.SIGINT, self._signal_handler)
-        self._original_sigterm_handler = signal.signal(signal.SIGTERM, self._signal_handler)
-        
-        # Register atexit handler as fallback
-        atexit.register(self._cleanup_at_exit)
+        # Register signal handlers for graceful shutdown. Signal handlers can only be installed from the main
+        # thread, and can be disabled when the robot is embedded in an application managing them itself.
+        self._original_sigint_handler = None
+        self._original_sigterm_handler = None
+        if threading.current_thread() is threading.main_thread() and config.install_signal_handlers:
+            self._original_sigint_handler = signal.signal(signal.SIGINT, self._signal_handler)
+            self._original_sigterm_handler = signal.signal(signal.SIGTERM, self._signal_handler)
+
+            # Register atexit handler as fallback
+            _register_robot(self)
 
     def _signal_handler(self, signum, frame):
         """Handle interrupt signals to ensure proper cleanup."""
@@ -206,134 +496,107 @@ class ManipulatorRobot:
                 exit(1)
 
     def _cleanup_at_exit(self):
-        """Cleanup function called at program exit."""
+        """Cleanup function called at program exit by `_cleanup_all`."""
         try:
             if getattr(self, 'is_connected', False):
                 print("Cleanup at exit: disconnecting robot...")
                 self.disconnect()
         except Exception as e:
             print(f"Error during exit cleanup: {e}")
+        finally:
+            self._shutdown_pools()
+
+    def _log_rate_limited(self, key: str, message: str, level: int = logging.WARNING):
+        """Log `message`, unless a message with the same `key` was logged less than `_WARNING_INTERVAL_S` ago."""
+        now = time.perf_counter()
+        if now - self._last_warning_t.get(key, float("-inf")) > _WARNING_INTERVAL_S:
+            self._last_warning_t[key] = now
+            logging.log(level, message)
+
+    def _start_log_step(self):
+        """Decide whether the durations of the reads and writes of the current step are logged."""
+        self._log_this_step = self._log_step % self._log_every == 0
+        self._log_step += 1
+
+    def _shutdown_pools(self):
+        """Release the tactile and observation reading threads, without waiting for pending reads."""
+        for attr in ("_tactile_pool", "_io_pool"):
+            pool = getattr(self, attr, None)
+            if pool is not None:
+                pool.shutdown(wait=False)
+                setattr(self, attr, None)
 
     def get_motor_names(self, arms: dict[str, MotorsBus]) -> list:
-        motor_names = []
-        for arm_name, arm in arms.items():
-            motor_names.extend(list(arm.motors.keys()))
-        return motor_names
+        return [motor for arm in arms.values() for motor in arm.motors]
 
     def _make_tactile_sensors_from_configs(self, configs: dict[str, TactileSensorConfig]) -> dict[str, TactileSensor]:
         """Create tactile sensor instances from configurations."""
         return make_tactile_sensors_from_configs(configs)
 
-    @property
+    @staticmethod
+    def _make_tactile_keys(name: str, sensor_type: str) -> SimpleNamespace:
+        """Build the observation keys (`obs`) and error `logs` keys of a tactile sensor."""
+        fields = (
+            "sensor_sn",
+            "frame_index",
+            "send_timestamp",
+            "recv_timestamp",
+            "positions_3d",
+            "displacements_3d",
+            "forces_3d",
+            "resultant_force",
+            "resultant_moment",
+            "tactile_image",
+        )
+        return SimpleNamespace(
+            obs=SimpleNamespace(**{field: f"observation.tactile.{sensor_type}.{name}.{field}" for field in fields}),
+            logs=SimpleNamespace(
+                critical_error=f"tactile_sensor_{name}_critical_error",
+                error_message=f"tactile_sensor_{name}_error_message",
+            ),
+        )
+
+    def _invalidate_features_cache(self):
+        """Drop the cached feature dicts, e.g. when the devices report their actual shapes on connect."""
+        for name in ("camera_features", "tactile_features", "motor_features", "features"):
+            self.__dict__.pop(name, None)
+
+    @cached_property
     def camera_features(self) -> dict:
         features = {}
         for name, camera in self.cameras.items():
             # TODO(rcadene): add more info (e.g. fps, width, height)
-            features[f"observation.images.{name}"] = {
+            features[self._camera_keys[name]] = {
                 "shape": (camera.height, camera.width, camera.channels),
                 "names": ["height", "width", "channels"],
                 "dtype": "video",
             }
         return features
 
-    @property
+    @cached_property
     def tactile_features(self) -> dict:
         """Return the features associated with tactile sensors."""
         tactile_ft = {}
         for name in self.tactile_sensors:
-            sensor = self.tactile_sensors[name]
-            
-            # 获取传感器类型
-            sensor_type = sensor.config.type if hasattr(sensor.config, 'type') else 'unknown'
-            
-            # 基本元数据 (所有传感器通用)
-            tactile_ft[f"observation.tactile.{sensor_type}.{name}.sensor_sn"] = {
-                "dtype": "string",
-                "shape": (1,),
-                "names": None,
-            }
-            tactile_ft[f"observation.tactile.{sensor_type}.{name}.frame_index"] = {
-                "dtype": "int64", 
-                "shape": (1,),
-                "names": None,
-            }
-            tactile_ft[f"observation.tactile.{sensor_type}.{name}.send_timestamp"] = {
-                "dtype": "float64",
-                "shape": (1,),
-                "names": None,
-            }
-            tactile_ft[f"observation.tactile.{sensor_type}.{name}.recv_timestamp"] = {
-                "dtype": "float64", 
-                "shape": (1,),
-                "names": None,
-            }
-            
-            if sensor_type == 'tac3d':
-                # Tac3D传感器特有的三维数据阵列 (400个标志点，每个3维坐标)
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.positions_3d"] = {
-                    "dtype": "float64",
-                    "shape": (400, 3),
-                    "names": ["marker_id", "coordinate"],
-                }
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.displacements_3d"] = {
-                    "dtype": "float64",
-                    "shape": (400, 3), 
-                    "names": ["marker_id", "coordinate"],
-                }
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.forces_3d"] = {
-                    "dtype": "float64",
-                    "shape": (400, 3),
-                    "names": ["marker_id", "coordinate"],
-                }
-                # 合成力和力矩 (3D向量)
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.resultant_force"] = {
-                    "dtype": "float64",
-                    "shape": (3,),
-                    "names": ["x", "y", "z"],
-                }
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.resultant_moment"] = {
-                    "dtype": "float64",
-                    "shape": (3,),
-                    "names": ["x", "y", "z"],
-                }
-
-            elif sensor_type == 'gelsight':
-                # GelSight传感器特有的图像数据
-                # 获取图像尺寸配置
-                imgh = getattr(sensor.config, 'imgh', 240)
-                imgw = getattr(sensor.config, 'imgw', 320)
-                
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.tactile_image"] = {
-                    "dtype": "uint8",
-                    "shape": (imgh, imgw, 3),
-                    "names": ["height", "width", "channel"],
-                }
-            elif sensor_type == 'digit':
-                # DIGIT传感器：只处理图像数据，移除力数据
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.tactile_image"] = {
-                    "dtype": "uint8",
-                    "shape": (240, 320, 3),
-                    "names": ["height", "width", "channel"],
+            keys = self._tactile_keys[name]
+            sensor_type = self._tactile_types[name]
+
+            if sensor_type == "gelsight":
+                imgh, imgw = self._tactile_image_sizes[name]
+                template = {
+                    **_TACTILE_METADATA_FEATURES,
+                    "tactile_image": {"dtype": "uint8", "shape": (imgh, imgw, 3), "names": _TACTILE_IMAGE_NAMES},
                 }
             else:
-                # 未知传感器类型，使用基本的力数据格式
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.resultant_force"] = {
-                    "dtype": "float64",
-                    "shape": (3,),
-                    "names": ["x", "y", "z"],
-                }
-                tactile_ft[f"observation.tactile.{sensor_type}.{name}.resultant_moment"] = {
-                    "dtype": "float64",
-                    "shape": (3,),
-                    "names": ["x", "y", "z"],
-                }
-                
+                template = _TACTILE_FEATURES_TEMPLATES.get(sensor_type, _UNKNOWN_TACTILE_FEATURES)
+
+            tactile_ft.update({getattr(keys.obs, field): ft for field, ft in template.items()})
         return tactile_ft
 
-    @property
+    @cached_property
     def motor_features(self) -> dict:
-        action_names = self.get_motor_names(self.leader_arms)
-        state_names = self.get_motor_names(self.leader_arms)
+        action_names = list(self._leader_motor_names)
+        state_names = list(self._leader_motor_names)
         return {
             "action": {
                 "dtype": "float32",
@@ -347,7 +610,7 @@ class ManipulatorRobot:
             },
         }
 
-    @property
+    @cached_property
     def features(self):
         return {**self.motor_features, **self.camera_features, **self.tactile_features}
 
@@ -381,25 +644,118 @@ class ManipulatorRobot:
                 "ManipulatorRobot doesn't have any device to connect. See example of usage in docstring of the class."
             )
 
-        # Connect the leader arms
-        for name in self.leader_arms:
-            print(f"Connecting {name} leader arm...")
-            self.leader_arms[name].connect()
+        # Check the CPU to pin the control loop to before connecting any device, which would be left connected.
+        control_loop_cpu = self.config.control_loop_cpu
+        if (
+            control_loop_cpu is not None
+            and hasattr(os, "sched_getaffinity")
+            and control_loop_cpu not in os.sched_getaffinity(0)
+        ):
+            raise ValueError(
+                f"`control_loop_cpu`={control_loop_cpu} is not one of the available CPUs "
+                f"{sorted(os.sched_getaffinity(0))}."
+            )
 
-        # Connect the follower arms
-        for name in self.follower_arms:
-            print(f"Connecting {name} follower arm...")
-            self.follower_arms[name].connect()
+        # Connect the leader arms, follower arms and cameras concurrently, since opening serial ports and
+        # starting cameras are independent and IO bound.
+        devices = (
+            [(f"{name} leader arm", arm) for name, arm in self.leader_arms.items()]
+            + [(f"{name} follower arm", arm) for name, arm in self.follower_arms.items()]
+            + [(f"{name} camera", camera) for name, camera in self.cameras.items()]
+        )
+        executor = ThreadPoolExecutor(max_workers=max(1, len(devices)), thread_name_prefix="connect")
+        future_to_device = {}
+        for device, instance in devices:
+            print(f"Connecting {device}...")
+            future_to_device[executor.submit(instance.connect)] = (device, instance)
+        try:
+            for future in as_completed(future_to_device):
+                # Raise the first connection error right away, without waiting for the other devices.
+                future.result()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            # Disconnect the devices which connected, or will once their pending connection succeeds.
+            for future, (device, instance) in future_to_device.items():
+                future.add_done_callback(partial(_disconnect_if_connected, device, instance))
+            raise
+        executor.shutdown()
+
+        # The tactile sensors are connected one by one afterwards, since some of them wait for their first
+        # frame without timeout.
+        connected_sensors = []
+        try:
+            for name, sensor in self.tactile_sensors.items():
+                print(f"Connecting {name} tactile sensor...")
+                sensor.connect()
+                connected_sensors.append((f"{name} tactile sensor", sensor))
+        except BaseException:
+            for device, instance in devices + connected_sensors:
+                _disconnect_device(device, instance)
+            raise
+
+        start = 0
+        for name, arm in self.follower_arms.items():
+            self._follower_slices[name] = slice(start, start + len(arm.motors))
+            start += len(arm.motors)
+        self._state_dim = start
+        self._only_follower = next(iter(self.follower_arms)) if len(self.follower_arms) == 1 else None
+        if self.config.max_relative_target is not None:
+            self._max_relative_targets = {
+                name: max_relative_target_array(self.config.max_relative_target, len(arm.motors))
+                for name, arm in self.follower_arms.items()
+            }
 
-        # Connect the cameras
+        for name in self.leader_arms:
+            self._log_keys["read_leader", name] = f"read_leader_{name}_pos_dt_s"
+        for name in self.follower_arms:
+            self._log_keys["write_follower", name] = f"write_follower_{name}_goal_pos_dt_s"
+            self._log_keys["read_follower", name] = f"read_follower_{name}_pos_dt_s"
         for name in self.cameras:
-            print(f"Connecting {name} camera...")
-            self.cameras[name].connect()
+            self._log_keys["read_camera", name] = f"read_camera_{name}_dt_s"
+            self._log_keys["async_read_camera", name] = f"async_read_camera_{name}_dt_s"
 
-        # Connect the tactile sensors
-        for name in self.tactile_sensors:
-            print(f"Connecting {name} tactile sensor...")
-            self.tactile_sensors[name].connect()
+        # Pinned memory speeds up the copies to the GPU, but is only available with CUDA.
+        self._pin_memory = self.config.pin_memory and torch.cuda.is_available()
+
+        for name, sensor in self.tactile_sensors.items():
+            sensor_type = self._tactile_types[name]
+            if sensor_type in ("gelsight", "digit"):
+                self._validate_tactile_image_shape(name, sensor)
+
+            if hasattr(sensor, "has_critical_error"):
+                self._tactile_error_checks.append(
+                    (name, sensor.has_critical_error, getattr(sensor, "get_error_status", None))
+                )
+
+            self._tactile_default_obs[name] = {}
+            self._fill_tactile_defaults(name, self._tactile_default_obs[name])
+
+            if sensor_type == "tac3d":
+                self._tactile_handlers[name] = self._make_tac3d_handler(name)
+            elif sensor_type in ("gelsight", "digit"):
+                self._tactile_handlers[name] = self._make_image_handler(name)
+            else:
+                self._tactile_handlers[name] = self._make_default_handler(name)
+
+        # Optionally pin the control loop to its own CPU, and the tactile workers, streaming threads and
+        # observation readers to the other ones. CPU affinity is only supported on Linux.
+        initializer = None
+        if control_loop_cpu is not None and hasattr(os, "sched_setaffinity"):
+            self._original_cpu_affinity = os.sched_getaffinity(0)
+            tactile_cpus = sorted(self._original_cpu_affinity - {control_loop_cpu})
+            if tactile_cpus:
+                initializer = _make_cpu_pinning_initializer(tactile_cpus)
+            os.sched_setaffinity(0, {control_loop_cpu})
+
+        # Reuse the same threads for every read instead of spawning them on each frame.
+        # Fallback to 1 worker if no sensors are present to avoid errors.
+        self._tactile_pool = ThreadPoolExecutor(
+            max_workers=max(1, len(self.tactile_sensors)), thread_name_prefix="tactile", initializer=initializer
+        )
+        # One worker for the followers and one for the cameras, also kept off the control loop CPU
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="observation", initializer=initializer
+        )
 
         self.activate_calibration()
 
@@ -410,6 +766,18 @@ class ManipulatorRobot:
         elif self.robot_type == "so100":
             self.set_so100_robot_preset()
 
+        if self.config.tactile_streaming and self.tactile_sensors:
+            # Started last, so that no polling thread is left running if connecting fails. Frames are kept
+            # as numpy arrays, and only wrapped into tensors when requested.
+            self._tactile_streamer = TactileStreamer(
+                self.tactile_sensors,
+                partial(self._process_tactile_frame, as_torch=False),
+                initializer=initializer,
+            )
+            self._tactile_streamer.start()
+
+        # Cameras may only know their resolution once connected.
+        self._invalidate_features_cache()
         self.is_connected = True
 
     def activate_calibration(self):
@@ -466,18 +834,18 @@ class ManipulatorRobot:
             # rotate more than 360 degrees (from 0 to 4095) And some mistake can happen while assembling the arm,
             # you could end up with a servo with a position 0 or 4095 at a crucial point See [
             # https://emanual.robotis.com/docs/en/dxl/x/x_series/#operating-mode11]
-            all_motors_except_gripper = [name for name in arm.motor_names if name != "gripper"]
-            if len(all_motors_except_gripper) > 0:
-                # 4 corresponds to Extended Position on Koch motors
-                arm.write("Operating_Mode", 4, all_motors_except_gripper)
-
+            # 4 corresponds to Extended Position on Koch motors
+            #
             # Use 'position control current based' for gripper to be limited by the limit of the current.
             # For the follower gripper, it means it can grasp an object without forcing too much even tho,
             # it's goal position is a complete grasp (both gripper fingers are ordered to join and reach a touch).
             # For the leader gripper, it means we can use it as a physical trigger, since we can force with our finger
             # to make it move, and it will move back to its original target position when we release the force.
             # 5 corresponds to Current Controlled Position on Koch gripper motors "xl330-m077, xl330-m288"
-            arm.write("Operating_Mode", 5, "gripper")
+            #
+            # Both modes are sent to all the motors in a single sync write packet.
+            operating_modes = [5 if name == "gripper" else 4 for name in arm.motor_names]
+            arm.write("Operating_Mode", operating_modes)
 
         for name in self.follower_arms:
             set_operating_mode_(self.follower_arms[name])
@@ -524,18 +892,18 @@ class ManipulatorRobot:
             # rotate more than 360 degrees (from 0 to 4095) And some mistake can happen while assembling the arm,
             # you could end up with a servo with a position 0 or 4095 at a crucial point See [
             # https://emanual.robotis.com/docs/en/dxl/x/x_series/#operating-mode11]
-            all_motors_except_gripper = [
-                name for name in self.follower_arms[name].motor_names if name != "gripper"
-            ]
-            if len(all_motors_except_gripper) > 0:
-                # 4 corresponds to Extended Position on Aloha motors
-                self.follower_arms[name].write("Operating_Mode", 4, all_motors_except_gripper)
-
+            # 4 corresponds to Extended Position on Aloha motors
+            #
             # Use 'position control current based' for follower gripper to be limited by the limit of the current.
             # It can grasp an object without forcing too much even tho,
             # it's goal position is a complete grasp (both gripper fingers are ordered to join and reach a touch).
             # 5 corresponds to Current Controlled Position on Aloha gripper follower "xm430-w350"
-            self.follower_arms[name].write("Operating_Mode", 5, "gripper")
+            #
+            # Both modes are sent to all the motors in a single sync write packet.
+            operating_modes = [
+                5 if motor_name == "gripper" else 4 for motor_name in self.follower_arms[name].motor_names
+            ]
+            self.follower_arms[name].write("Operating_Mode", operating_modes)
 
             # Note: We can't enable torque on the leader gripper since "xc430-w150" doesn't have
             # a Current Controlled Position mode.
@@ -563,425 +931,363 @@ class ManipulatorRobot:
             self.follower_arms[name].write("Maximum_Acceleration", 254)
             self.follower_arms[name].write("Acceleration", 254)
 
-    def _get_tactile_observation(self) -> dict[str, torch.Tensor | str]:
+    def _validate_tactile_image_shape(self, name: str, sensor: TactileSensor):
+        """Lock in the image shape of a GelSight/DIGIT sensor from its first frame.
+
+        This is done once at connection time, so that only a shape comparison is needed per frame. When no
+        valid frame is available yet, the shape declared in `tactile_features` is used.
+        """
+        shape = (*self._tactile_image_sizes[name], 3)
+
+        try:
+            data = sensor.read()
+        except Exception as e:
+            print(f"Warning: Could not read a first frame from tactile sensor {name}: {e}")
+            data = None
+
+        image = None
+        if data:
+            image = data.get("tactile_image")
+            if image is None:
+                image = data.get("image")
+        if isinstance(image, np.ndarray) and image.ndim == 3 and image.shape[2] == 3:
+            shape = image.shape
+        elif image is not None:
+            print(f"Warning: Tactile sensor {name} returned an image with wrong format, expected (H, W, 3)")
+
+        self._tactile_image_shapes[name] = tuple(shape)
+        self._tactile_empty_images[name] = np.zeros(shape, dtype=np.uint8)
+
+    def _image_array(self, name: str, data: dict) -> np.ndarray:
+        """Return the image of a GelSight/DIGIT frame without copying it."""
+        image = data.get("tactile_image")
+        if image is None:
+            # 兼容image字段
+            image = data.get("image")
+
+        if isinstance(image, np.ndarray) and image.shape == self._tactile_image_shapes[name]:
+            if not image.flags["C_CONTIGUOUS"]:
+                image = np.ascontiguousarray(image)
+            return image
+
+        if image is not None:
+            self._log_rate_limited(
+                f"{name}_image_format",
+                f"Tactile sensor {name} image has wrong format, expected {self._tactile_image_shapes[name]}",
+            )
+        return self._tactile_empty_images[name]
+
+    def _make_tac3d_handler(self, name: str):
+        """Build the function formatting the frames of the Tac3D sensor `name` into `obs_dict`."""
+        keys = self._tactile_keys[name].obs
+
+        def process(data: dict, obs_dict: dict):
+            # TAC3D传感器：使用tac3d.py返回的标准化字段名
+            obs_dict[keys.sensor_sn] = data.get("SN", "")
+            obs_dict[keys.frame_index] = np.array([data.get("index", 0)], dtype=np.int64)
+            obs_dict[keys.send_timestamp] = np.array(
+                [data.get("sendTimestamp", 0.0) if "sendTimestamp" in data else data.get("recvTimestamp", 0.0)],
+                dtype=np.float64,
+            )
+            obs_dict[keys.recv_timestamp] = np.array([data.get("recvTimestamp", 0.0)], dtype=np.float64)
+
+            # Tac3D传感器的三维数据阵列
+            positions, displacements, forces_3d = _tac3d_arrays(data)
+            obs_dict[keys.positions_3d] = positions
+            obs_dict[keys.displacements_3d] = displacements
+            obs_dict[keys.forces_3d] = forces_3d
+
+            # 合成力和力矩, handle both (3,) and (1,3) shapes
+            obs_dict[keys.resultant_force] = _force3(data.get("resultant_force"))
+            obs_dict[keys.resultant_moment] = _force3(data.get("resultant_moment"))
+
+        return process
+
+    def _make_image_handler(self, name: str):
+        """Build the function formatting the frames of the GelSight/DIGIT sensor `name` into `obs_dict`."""
+        keys = self._tactile_keys[name].obs
+        image_array = self._image_array
+
+        def process(data: dict, obs_dict: dict):
+            # GelSight/DIGIT传感器：gelsight.py/digit.py 直接返回 float 时间戳，无需转换
+            obs_dict[keys.sensor_sn] = data.get("device_name", "")
+            obs_dict[keys.frame_index] = np.array([data.get("frame_index", 0)], dtype=np.int64)
+            timestamp = data.get("timestamp", time.time())
+            obs_dict[keys.send_timestamp] = np.array([timestamp], dtype=np.float64)
+            obs_dict[keys.recv_timestamp] = np.array([timestamp], dtype=np.float64)
+
+            # 图像形状已在connect时验证，这里只需比较形状
+            obs_dict[keys.tactile_image] = image_array(name, data)
+
+        return process
+
+    def _make_default_handler(self, name: str):
+        """Build the function formatting the frames of a sensor of unknown type, which only has default values."""
+
+        default_obs = self._tactile_default_obs[name]
+
+        def process(data: dict, obs_dict: dict):
+            # 未知传感器类型，使用基本的力数据格式
+            obs_dict.update(default_obs)
+
+        return process
+
+    def _fill_tactile_defaults(self, name: str, obs_dict: dict):
+        """Fill `obs_dict` with the default values of the sensor `name`, used when it has no data."""
+        keys = self._tactile_keys[name].obs
+        sensor_type = self._tactile_types[name]
+
+        # 基本元数据 (所有传感器通用)
+        obs_dict[keys.sensor_sn] = ""
+        obs_dict[keys.frame_index] = _ZERO_1_I64
+        obs_dict[keys.send_timestamp] = _ZERO_1_F64
+        obs_dict[keys.recv_timestamp] = _ZERO_1_F64
+
+        if sensor_type == "tac3d":
+            obs_dict[keys.positions_3d] = _ZERO_400X3_F64
+            obs_dict[keys.displacements_3d] = _ZERO_400X3_F64
+            obs_dict[keys.forces_3d] = _ZERO_400X3_F64
+            obs_dict[keys.resultant_force] = _ZERO_3_F64
+            obs_dict[keys.resultant_moment] = _ZERO_3_F64
+        elif sensor_type in ("gelsight", "digit"):
+            obs_dict[keys.tactile_image] = self._tactile_empty_images[name]
+        else:
+            obs_dict[keys.resultant_force] = _ZERO_3_F64
+            obs_dict[keys.resultant_moment] = _ZERO_3_F64
+
+    def _process_tactile_frame(
+        self, name: str, data: dict | None, as_torch: bool = True
+    ) -> dict[str, torch.Tensor | np.ndarray | str]:
+        """Format the raw data read from the tactile sensor `name` into its observation entries.
+
+        `data` is None (or empty) when the sensor did not return any frame, in which case default values
+        are used. Arrays are returned as numpy arrays when `as_torch` is False.
+        """
+        if data:
+            obs_dict = {}
+            self._tactile_handlers[name](data, obs_dict)
+        else:
+            # 如果没有数据，根据传感器类型填充默认值
+            obs_dict = self._tactile_default_obs[name].copy()
+        return self._tactile_to_torch(obs_dict) if as_torch else obs_dict
+
+    def _tactile_to_torch(self, obs_dict: dict) -> dict[str, torch.Tensor | str]:
+        """Convert the numpy arrays of tactile observations into tensors with `_to_tensor`."""
+        return {
+            key: self._to_tensor(value) if isinstance(value, np.ndarray) else value
+            for key, value in obs_dict.items()
+        }
+
+    def _to_tensor(self, array: np.ndarray) -> torch.Tensor:
+        """Convert an observation array to a tensor, copied to pinned memory when `config.pin_memory` is set
+        and CUDA is available. A new copy is made on each frame, since the observations are kept by the caller.
+        """
+        tensor = torch.from_numpy(array)
+        return tensor.pin_memory() if self._pin_memory else tensor
+
+    def _get_tactile_observation(self, as_torch: bool = True) -> dict[str, torch.Tensor | np.ndarray | str]:
         """
         Reads data from all tactile sensors in parallel using multithreading and processes it.
         This ensures better data synchronization when using multiple sensors.
-        """
-        # Stage 1: Parallel read data from all tactile sensors
-        tactile_data_raw = {}
-        before_tactile_read_t = time.perf_counter()
-        # Use max_workers=len(self.tactile_sensors) to read from all sensors concurrently.
-        # Fallback to 1 worker if no sensors are present to avoid errors.
-        with ThreadPoolExecutor(max_workers=len(self.tactile_sensors) or 1) as executor:
-            future_to_name = {executor.submit(sensor.read): name for name, sensor in self.tactile_sensors.items()}
-            for future in as_completed(future_to_name):
-                name = future_to_name[future]
-                try:
-                    tactile_data_raw[name] = future.result()
-                except Exception as e:
-                    print(f"Warning: Error reading from tactile sensor {name}: {e}")
-                    tactile_data_raw[name] = None
-        self.logs["read_all_tactile_parallel_dt_s"] = time.perf_counter() - before_tactile_read_t
-
-        # Stage 2: Process raw data into a temporary flat dictionary `tactile_data`
-        tactile_data = {}
-        for name, data in tactile_data_raw.items():
-            sensor = self.tactile_sensors[name]
-            sensor_type = getattr(sensor.config, "type", "unknown")
-
-            if data:
-                if sensor_type == "tac3d":
-                    # TAC3D传感器：使用tac3d.py返回的标准化字段名
-                    tactile_data[f"{name}_sensor_sn"] = data.get("SN", "")
-                    tactile_data[f"{name}_frame_index"] = torch.tensor(
-                        [data.get("index", 0)], dtype=torch.int64
-                    )
-                    tactile_data[f"{name}_send_timestamp"] = torch.tensor(
-                        [data.get("sendTimestamp", 0.0) if "sendTimestamp" in data else data.get("recvTimestamp", 0.0)], dtype=torch.float64
-                    )
-                    tactile_data[f"{name}_recv_timestamp"] = torch.tensor(
-                        [data.get("recvTimestamp", 0.0)], dtype=torch.float64
-                    )
-                elif sensor_type == "gelsight":
-                    # GelSight传感器：优化的数据处理 - 移除昂贵的类型检查
-                    tactile_data[f"{name}_sensor_sn"] = data.get("device_name", "")
-                    tactile_data[f"{name}_frame_index"] = torch.tensor(
-                        [data.get("frame_index", 0)], dtype=torch.int64
-                    )
-                    # 关键优化：gelsight.py 现在直接返回 float 时间戳，无需转换
-                    gelsight_timestamp = data.get("timestamp", time.time())
-                    tactile_data[f"{name}_send_timestamp"] = torch.tensor(
-                        [gelsight_timestamp], dtype=torch.float64
-                    )
-                    tactile_data[f"{name}_recv_timestamp"] = torch.tensor(
-                        [gelsight_timestamp], dtype=torch.float64
-                    )
-                elif sensor_type == "digit":
-                    # DIGIT传感器：只处理图像数据，移除力数据
-                    tactile_data[f"{name}_sensor_sn"] = data.get("device_name", "")
-                    tactile_data[f"{name}_frame_index"] = torch.tensor(
-                        [data.get("frame_index", 0)], dtype=torch.int64
-                    )
-                    timestamp = data.get("timestamp", time.time())
-                    tactile_data[f"{name}_send_timestamp"] = torch.tensor([timestamp], dtype=torch.float64)
-                    tactile_data[f"{name}_recv_timestamp"] = torch.tensor([timestamp], dtype=torch.float64)
-                    
-                    # 处理图像数据，确保格式正确
-                    if "tactile_image" in data and data["tactile_image"] is not None:
-                        image = data["tactile_image"]
-                        # 验证图像格式
-                        if isinstance(image, np.ndarray):
-                            # 检查维度和形状
-                            if image.ndim == 3 and image.shape[2] == 3:
-                                # 图像格式正确，转换为torch.Tensor
-                                tactile_data[f"{name}_tactile_image"] = torch.from_numpy(image)
-                            else:
-                                # 图像维度不正确，尝试修复
-                                print(f"Warning: DIGIT image has wrong shape: {image.shape}, expected (H, W, 3)")
-                                if image.ndim == 1 and len(image) == 240 * 320 * 3:
-                                    # 尝试重塑一维数组
-                                    try:
-                                        image = image.reshape(240, 320, 3)
-                                        tactile_data[f"{name}_tactile_image"] = torch.from_numpy(image)
-                                    except:
-                                        # 重塑失败，创建空图像
-                                        tactile_data[f"{name}_tactile_image"] = torch.zeros((240, 320, 3), dtype=torch.uint8)
-                                else:
-                                    # 无法修复，创建空图像
-                                    tactile_data[f"{name}_tactile_image"] = torch.zeros((240, 320, 3), dtype=torch.uint8)
-                        else:
-                            # 不是numpy数组，创建空图像
-                            print(f"Warning: DIGIT image is not a numpy array: {type(image)}")
-                            tactile_data[f"{name}_tactile_image"] = torch.zeros((240, 320, 3), dtype=torch.uint8)
-                    elif "image" in data and data["image"] is not None:
-                        # 兼容image字段
-                        image = data["image"]
-                        if isinstance(image, np.ndarray) and image.ndim == 3 and image.shape[2] == 3:
-                            tactile_data[f"{name}_tactile_image"] = torch.from_numpy(image)
-                        else:
-                            print(f"Warning: DIGIT image (from 'image' field) has wrong format")
-                            tactile_data[f"{name}_tactile_image"] = torch.zeros((240, 320, 3), dtype=torch.uint8)
-                    else:
-                        # 没有图像数据，创建空图像
-                        tactile_data[f"{name}_tactile_image"] = torch.zeros((240, 320, 3), dtype=torch.uint8)
-                else:
-                    tactile_data[f"{name}_resultant_force"] = torch.zeros(3, dtype=torch.float64)
-                    tactile_data[f"{name}_resultant_moment"] = torch.zeros(3, dtype=torch.float64)
-
-                if sensor_type == "tac3d":
-                    # Tac3D传感器的三维数据阵列
-                    if "3D_Positions" in data and data["3D_Positions"] is not None:
-                        positions = data["3D_Positions"]
-                        tactile_data[f"{name}_positions_3d"] = torch.from_numpy(
-                            positions.astype(np.float64)
-                        )
-                    else:
-                        tactile_data[f"{name}_positions_3d"] = torch.zeros((400, 3), dtype=torch.float64)
-
-                    if "3D_Displacements" in data and data["3D_Displacements"] is not None:
-                        displacements = data["3D_Displacements"]
-                        tactile_data[f"{name}_displacements_3d"] = torch.from_numpy(
-                            displacements.astype(np.float64)
-                        )
-                    else:
-                        tactile_data[f"{name}_displacements_3d"] = torch.zeros((400, 3), dtype=torch.float64)
-
-                    if "3D_Forces" in data and data["3D_Forces"] is not None:
-                        forces_3d = data["3D_Forces"]
-                        tactile_data[f"{name}_forces_3d"] = torch.from_numpy(forces_3d.astype(np.float64))
-                    else:
-                        tactile_data[f"{name}_forces_3d"] = torch.zeros((400, 3), dtype=torch.float64)
-
-                    # 合成力和力矩
-                    if "resultant_force" in data and data["resultant_force"] is not None:
-                        force = data["resultant_force"]
-                        if isinstance(force, np.ndarray) and force.size >= 3:
-                            # Handle both (3,) and (1,3) shapes
-                            if force.ndim == 1:
-                                tactile_data[f"{name}_resultant_force"] = torch.tensor(
-                                    [force[0], force[1], force[2]], dtype=torch.float64
-                                )
-                            elif force.ndim == 2 and force.shape[0] >= 1:
-                                tactile_data[f"{name}_resultant_force"] = torch.tensor(
-                                    [force[0, 0], force[0, 1], force[0, 2]], dtype=torch.float64
-                                )
-                            else:
-                                tactile_data[f"{name}_resultant_force"] = torch.zeros(3, dtype=torch.float64)
-                        else:
-                            tactile_data[f"{name}_resultant_force"] = torch.zeros(3, dtype=torch.float64)
-                    else:
-                        tactile_data[f"{name}_resultant_force"] = torch.zeros(3, dtype=torch.float64)
-
-                    if "resultant_moment" in data and data["resultant_moment"] is not None:
-                        moment = data["resultant_moment"]
-                        if isinstance(moment, np.ndarray) and moment.size >= 3:
-                            # Handle both (3,) and (1,3) shapes
-                            if moment.ndim == 1:
-                                tactile_data[f"{name}_resultant_moment"] = torch.tensor(
-                                    [moment[0], moment[1], moment[2]], dtype=torch.float64
-                                )
-                            elif moment.ndim == 2 and moment.shape[0] >= 1:
-                                tactile_data[f"{name}_resultant_moment"] = torch.tensor(
-                                    [moment[0, 0], moment[0, 1], moment[0, 2]], dtype=torch.float64
-                                )
-                            else:
-                                tactile_data[f"{name}_resultant_moment"] = torch.zeros(
-                                    3, dtype=torch.float64
-                                )
-                        else:
-                            tactile_data[f"{name}_resultant_moment"] = torch.zeros(3, dtype=torch.float64)
-                    else:
-                        tactile_data[f"{name}_resultant_moment"] = torch.zeros(3, dtype=torch.float64)
-
-                elif sensor_type == "gelsight":
-                    # GelSight传感器的图像数据
-                    if "tactile_image" in data and data["tactile_image"] is not None:
-                        image = data["tactile_image"]
-                        tactile_data[f"{name}_tactile_image"] = torch.from_numpy(image)
-                    elif "image" in data and data["image"] is not None:
-                        # 兼容image字段
-                        image = data["image"]
-                        tactile_data[f"{name}_tactile_image"] = torch.from_numpy(image)
-                else:
-                    # 未知传感器类型，使用基本的力数据格式
-                    tactile_data[f"{name}_resultant_force"] = torch.zeros(3, dtype=torch.float64)
-                    tactile_data[f"{name}_resultant_moment"] = torch.zeros(3, dtype=torch.float64)
 
-            else:
-                # 如果没有数据，根据传感器类型填充默认值
-                tactile_data[f"{name}_sensor_sn"] = ""
-                tactile_data[f"{name}_frame_index"] = torch.tensor([0], dtype=torch.int64)
-                tactile_data[f"{name}_send_timestamp"] = torch.tensor([0.0], dtype=torch.float64)
-                tactile_data[f"{name}_recv_timestamp"] = torch.tensor([0.0], dtype=torch.float64)
-
-                if sensor_type == "tac3d":
-                    tactile_data[f"{name}_positions_3d"] = torch.zeros((400, 3), dtype=torch.float64)
-                    tactile_data[f"{name}_displacements_3d"] = torch.zeros((400, 3), dtype=torch.float64)
-                    tactile_data[f"{name}_forces_3d"] = torch.zeros((400, 3), dtype=torch.float64)
-                    tactile_data[f"{name}_resultant_force"] = torch.zeros(3, dtype=torch.float64)
-                    tactile_data[f"{name}_resultant_moment"] = torch.zeros(3, dtype=torch.float64)
-                elif sensor_type == "gelsight":
-                    imgh = getattr(sensor.config, "imgh", 240)
-                    imgw = getattr(sensor.config, "imgw", 320)
-                    tactile_data[f"{name}_tactile_image"] = torch.zeros((imgh, imgw, 3), dtype=torch.uint8)
-                elif sensor_type == "digit":
-                    # DIGIT传感器默认图像大小
-                    tactile_data[f"{name}_tactile_image"] = torch.zeros((240, 320, 3), dtype=torch.uint8)
-                else:
-                    tactile_data[f"{name}_resultant_force"] = torch.zeros(3, dtype=torch.float64)
-                    tactile_data[f"{name}_resultant_moment"] = torch.zeros(3, dtype=torch.float64)
+        When tactile streaming is enabled, the latest frames already formatted by the background
+        threads are returned instead.
 
-        # Stage 3: Populate the final observation dictionary with the correct hierarchical keys.
+        When `as_torch` is False, numpy arrays are returned instead of tensors. The GelSight/DIGIT images may
+        alias the frame returned by the sensor, but are copied to pinned memory when `as_torch` is True and
+        `config.pin_memory` is in use, so callers must not rely on either.
+        """
+        if self._tactile_streamer is not None:
+            obs_dict = self._tactile_streamer.snapshot()
+            return self._tactile_to_torch(obs_dict) if as_torch else obs_dict
+
+        # Read and format the data of all tactile sensors in parallel, each sensor in its own worker.
+        # Note: `read` does not perform blocking file/device IO. Tac3D frames are pushed by a UDP callback and
+        # GelSight/DIGIT frames by background reader threads, so each read only snapshots the latest frame.
+        if self._profile:
+            before_tactile_read_t = time.perf_counter()
+        executor = self._tactile_pool
+        futures = {name: executor.submit(self._read_tactile_frame, name) for name in self.tactile_sensors}
+
+        # Gather the observations in the order of the sensors
         obs_dict = {}
-        for name in self.tactile_sensors:
-            sensor = self.tactile_sensors[name]
-            sensor_type = getattr(sensor.config, "type", "unknown")
+        for future in futures.values():
+            obs_dict.update(future.result())
+        if self._profile:
+            dt_s = time.perf_counter() - before_tactile_read_t
+            self._tactile_read_dt_s.append(dt_s)
+            self.logs["read_all_tactile_parallel_dt_s"] = dt_s
 
-            # 基本元数据 (所有传感器通用)
-            obs_dict[f"observation.tactile.{sensor_type}.{name}.sensor_sn"] = tactile_data[
-                f"{name}_sensor_sn"
-            ]
-            obs_dict[f"observation.tactile.{sensor_type}.{name}.frame_index"] = tactile_data[
-                f"{name}_frame_index"
-            ]
-            obs_dict[f"observation.tactile.{sensor_type}.{name}.send_timestamp"] = tactile_data[
-                f"{name}_send_timestamp"
-            ]
-            obs_dict[f"observation.tactile.{sensor_type}.{name}.recv_timestamp"] = tactile_data[
-                f"{name}_recv_timestamp"
-            ]
+        return self._tactile_to_torch(obs_dict) if as_torch else obs_dict
 
-            if sensor_type == "tac3d":
-                # Tac3D传感器特有的三维数据
-                obs_dict[f"observation.tactile.{sensor_type}.{name}.positions_3d"] = tactile_data[
-                    f"{name}_positions_3d"
-                ]
-                obs_dict[f"observation.tactile.{sensor_type}.{name}.displacements_3d"] = tactile_data[
-                    f"{name}_displacements_3d"
-                ]
-                obs_dict[f"observation.tactile.{sensor_type}.{name}.forces_3d"] = tactile_data[
-                    f"{name}_forces_3d"
-                ]
-                obs_dict[f"observation.tactile.{sensor_type}.{name}.resultant_force"] = tactile_data[
-                    f"{name}_resultant_force"
-                ]
-                obs_dict[f"observation.tactile.{sensor_type}.{name}.resultant_moment"] = tactile_data[
-                    f"{name}_resultant_moment"
-                ]
-            elif sensor_type == "gelsight":
-                # GelSight传感器特有的图像数据
-                obs_dict[f"observation.tactile.{sensor_type}.{name}.tactile_image"] = tactile_data[
-                    f"{name}_tactile_image"
-                ]
-            elif sensor_type == "digit":
-                # DIGIT传感器：只有图像数据
-                if f"{name}_tactile_image" in tactile_data:
-                    obs_dict[f"observation.tactile.{sensor_type}.{name}.tactile_image"] = tactile_data[
-                        f"{name}_tactile_image"
-                    ]
-            else:
-                # 未知传感器类型，添加基本的力数据
-                if f"{name}_resultant_force" in tactile_data:
-                    obs_dict[
-                        f"observation.tactile.{sensor_type}.{name}.resultant_force"
-                    ] = tactile_data[f"{name}_resultant_force"]
-                if f"{name}_resultant_moment" in tactile_data:
-                    obs_dict[
-                        f"observation.tactile.{sensor_type}.{name}.resultant_moment"
-                    ] = tactile_data[f"{name}_resultant_moment"]
-        return obs_dict
+    def _read_tactile_frame(self, name: str) -> dict[str, np.ndarray | str]:
+        """Read the latest frame of the tactile sensor `name` and format it, run by the tactile workers."""
+        try:
+            data = self.tactile_sensors[name].read()
+        except Exception as e:
+            self._log_rate_limited(f"{name}_read", f"Error reading from tactile sensor {name}: {e}")
+            data = None
+        return self._process_tactile_frame(name, data, as_torch=False)
 
     def teleop_step(
-        self, record_data=False
+        self, record_data=False, as_torch: bool = True
     ) -> None | tuple[dict[str, torch.Tensor], dict[str, torch.Tensor]]:
+        """Set the follower arms to the position of the leader arms.
+
+        When `record_data` is True, the observations and actions are returned. Tactile observations are
+        returned as numpy arrays when `as_torch` is False, e.g. when they are only written to a dataset.
+        """
         if not self.is_connected:
             raise RobotDeviceNotConnectedError(
                 "ManipulatorRobot is not connected. You need to run `robot.connect()`."
             )
 
-        # Prepare to assign the position of the leader to the follower
+        self._start_log_step()
+        log = self._log_this_step
+
+        # Prepare to assign the position of the leader to the follower. Positions are kept as the numpy
+        # arrays read from and written to the motors, and only converted to tensors when recording.
         leader_pos = {}
         for name in self.leader_arms:
-            before_lread_t = time.perf_counter()
+            if log:
+                before_lread_t = time.perf_counter()
             leader_pos[name] = self.leader_arms[name].read("Present_Position")
-            leader_pos[name] = torch.from_numpy(leader_pos[name])
-            self.logs[f"read_leader_{name}_pos_dt_s"] = time.perf_counter() - before_lread_t
+            if log:
+                self.logs[self._log_keys["read_leader", name]] = time.perf_counter() - before_lread_t
 
         # Send goal position to the follower
         follower_goal_pos = {}
         for name in self.follower_arms:
-            before_fwrite_t = time.perf_counter()
+            if log:
+                before_fwrite_t = time.perf_counter()
             goal_pos = leader_pos[name]
 
             # Cap goal position when too far away from present position.
             # Slower fps expected due to reading from the follower.
             if self.config.max_relative_target is not None:
                 present_pos = self.follower_arms[name].read("Present_Position")
-                present_pos = torch.from_numpy(present_pos)
-                goal_pos = ensure_safe_goal_position(goal_pos, present_pos, self.config.max_relative_target)
+                goal_pos = ensure_safe_goal_position_np(goal_pos, present_pos, self._max_relative_targets[name])
 
             # Used when record_data=True
             follower_goal_pos[name] = goal_pos
 
-            goal_pos = goal_pos.numpy().astype(np.float32)
-            self.follower_arms[name].write("Goal_Position", goal_pos)
-            self.logs[f"write_follower_{name}_goal_pos_dt_s"] = time.perf_counter() - before_fwrite_t
+            self.follower_arms[name].write("Goal_Position", goal_pos.astype(np.float32, copy=False))
+            if log:
+                self.logs[self._log_keys["write_follower", name]] = time.perf_counter() - before_fwrite_t
 
         # Early exit when recording data is not requested
         if not record_data:
             return
 
         # TODO(rcadene): Add velocity and other info
-        # Read follower position
-        follower_pos = {}
-        for name in self.follower_arms:
-            before_fread_t = time.perf_counter()
-            follower_pos[name] = self.follower_arms[name].read("Present_Position")
-            follower_pos[name] = torch.from_numpy(follower_pos[name])
-            self.logs[f"read_follower_{name}_pos_dt_s"] = time.perf_counter() - before_fread_t
-
-        # Create state by concatenating follower current position
-        state = []
-        for name in self.follower_arms:
-            if name in follower_pos:
-                state.append(follower_pos[name])
-        state = torch.cat(state)
+        obs_dict = self._build_observation(as_torch=as_torch)
 
         # Create action by concatenating follower goal position
-        action = []
-        for name in self.follower_arms:
-            if name in follower_goal_pos:
-                action.append(follower_goal_pos[name])
-        action = torch.cat(action)
-
-        # Capture images from cameras
-        images = {}
-        for name in self.cameras:
-            before_camread_t = time.perf_counter()
-            images[name] = self.cameras[name].async_read()
-            images[name] = torch.from_numpy(images[name])
-            self.logs[f"read_camera_{name}_dt_s"] = self.cameras[name].logs["delta_timestamp_s"]
-            self.logs[f"async_read_camera_{name}_dt_s"] = time.perf_counter() - before_camread_t
-
-        # Read tactile sensor data in parallel
-        tactile_obs = self._get_tactile_observation()
-        
-        # 检查触觉传感器是否有关键错误
-        for name, sensor in self.tactile_sensors.items():
-            if hasattr(sensor, 'has_critical_error') and sensor.has_critical_error():
-                error_status = sensor.get_error_status() if hasattr(sensor, 'get_error_status') else {}
-                error_msg = error_status.get('error_message', 'Unknown critical error')
-                print(f"🚨 触觉传感器 {name} 发生关键错误: {error_msg}")
-                print(f"⚠️  强烈建议立即停止录制！按ESC键或Ctrl+C退出录制。")
-                
-                # 将错误信息添加到logs中，以便上层调用者知道
-                self.logs[f"tactile_sensor_{name}_critical_error"] = True
-                self.logs[f"tactile_sensor_{name}_error_message"] = error_msg
-
-        # Populate output dictionaries and format to pytorch
-        obs_dict = {}
-        obs_dict["observation.state"] = state
-        for name in self.cameras:
-            obs_dict[f"observation.images.{name}"] = images[name]
-        obs_dict.update(tactile_obs)
+        action = self._concat_follower_positions(follower_goal_pos)
 
         # 创建action字典
         action_dict = {"action": action}
 
         return obs_dict, action_dict
 
-    def capture_observation(self):
-        """The returned observations do not have a batch dimension."""
+    def capture_observation(self, as_torch: bool = True):
+        """The returned observations do not have a batch dimension.
+
+        Tactile observations are returned as numpy arrays when `as_torch` is False, e.g. when they are only
+        written to a dataset. GelSight/DIGIT images may alias the sensor frame, unless copied to pinned memory.
+        """
         if not self.is_connected:
             raise RobotDeviceNotConnectedError(
                 "ManipulatorRobot is not connected. You need to run `robot.connect()`."
             )
 
-        # Read follower position
+        self._start_log_step()
+        return self._build_observation(as_torch=as_torch)
+
+    def _new_state_tensor(self) -> torch.Tensor:
+        """Allocate the vector of a state or action of the follower arms, filled arm by arm.
+
+        A new tensor is allocated on each frame, since the returned observations and actions are kept by the
+        caller (e.g. the dataset episode buffer).
+        """
+        return torch.empty(self._state_dim, dtype=torch.float32, pin_memory=self._pin_memory)
+
+    def _concat_follower_positions(self, positions: dict[str, np.ndarray]) -> torch.Tensor:
+        """Concatenate the positions of the follower arms into a state or action vector.
+
+        With a single follower arm, its positions are wrapped without a copy. They are new arrays read from the
+        motors or computed on each step, so they are not shared between frames.
+        """
+        if self._only_follower is not None:
+            return self._to_tensor(positions[self._only_follower].astype(np.float32, copy=False))
+
+        state = self._new_state_tensor()
+        for name, pos in positions.items():
+            state[self._follower_slices[name]] = torch.from_numpy(pos)
+        return state
+
+    def _read_follower_state(self) -> torch.Tensor:
+        # Read follower position, and create state by concatenating follower current position
+        log = self._log_this_step
         follower_pos = {}
         for name in self.follower_arms:
-            before_fread_t = time.perf_counter()
+            if log:
+                before_fread_t = time.perf_counter()
             follower_pos[name] = self.follower_arms[name].read("Present_Position")
-            follower_pos[name] = torch.from_numpy(follower_pos[name])
-            self.logs[f"read_follower_{name}_pos_dt_s"] = time.perf_counter() - before_fread_t
-
-        # Create state by concatenating follower current position
-        state = []
-        for name in self.follower_arms:
-            if name in follower_pos:
-                state.append(follower_pos[name])
-        state = torch.cat(state)
+            if log:
+                self.logs[self._log_keys["read_follower", name]] = time.perf_counter() - before_fread_t
+        return self._concat_follower_positions(follower_pos)
 
+    def _read_camera_images(self) -> dict[str, torch.Tensor]:
         # Capture images from cameras
+        log = self._log_this_step
         images = {}
         for name in self.cameras:
-            before_camread_t = time.perf_counter()
+            if log:
+                before_camread_t = time.perf_counter()
             images[name] = self.cameras[name].async_read()
-            images[name] = torch.from_numpy(images[name])
-            self.logs[f"read_camera_{name}_dt_s"] = self.cameras[name].logs["delta_timestamp_s"]
-            self.logs[f"async_read_camera_{name}_dt_s"] = time.perf_counter() - before_camread_t
+            images[name] = self._to_tensor(images[name])
+            if log:
+                self.logs[self._log_keys["read_camera", name]] = self.cameras[name].logs["delta_timestamp_s"]
+                self.logs[self._log_keys["async_read_camera", name]] = time.perf_counter() - before_camread_t
+        return images
+
+    def _build_observation(self, as_torch: bool = True) -> dict:
+        """Read the followers, cameras and tactile sensors into an observation.
+
+        Shared by `teleop_step` and `capture_observation`.
+        """
+        # Read the followers and cameras in the background while the tactile sensors are read, since all of
+        # them wait on their devices independently.
+        state_future = self._io_pool.submit(self._read_follower_state)
+        images_future = self._io_pool.submit(self._read_camera_images)
 
         # Read tactile sensor data in parallel
-        tactile_obs = self._get_tactile_observation()
-        
+        tactile_obs = self._get_tactile_observation(as_torch=as_torch)
+        state = state_future.result()
+        images = images_future.result()
+
         # 检查触觉传感器是否有关键错误
-        for name, sensor in self.tactile_sensors.items():
-            if hasattr(sensor, 'has_critical_error') and sensor.has_critical_error():
-                error_status = sensor.get_error_status() if hasattr(sensor, 'get_error_status') else {}
+        for name, has_critical_error, get_error_status in self._tactile_error_checks:
+            if has_critical_error():
+                error_status = get_error_status() if get_error_status is not None else {}
                 error_msg = error_status.get('error_message', 'Unknown critical error')
-                print(f"🚨 触觉传感器 {name} 发生关键错误: {error_msg}")
-                print(f"⚠️  强烈建议立即停止录制！按ESC键或Ctrl+C退出录制。")
-                
+                self._log_rate_limited(
+                    f"{name}_critical_error",
+                    f"🚨 触觉传感器 {name} 发生关键错误: {error_msg}\n⚠️  强烈建议立即停止录制！按ESC键或Ctrl+C退出录制。",
+                    level=logging.ERROR,
+                )
+
                 # 将错误信息添加到logs中，以便上层调用者知道
-                self.logs[f"tactile_sensor_{name}_critical_error"] = True
-                self.logs[f"tactile_sensor_{name}_error_message"] = error_msg
+                log_keys = self._tactile_keys[name].logs
+                self.logs[log_keys.critical_error] = True
+                self.logs[log_keys.error_message] = error_msg
 
         # Populate output dictionaries and format to pytorch
         obs_dict = {}
         obs_dict["observation.state"] = state
         for name in self.cameras:
-            obs_dict[f"observation.images.{name}"] = images[name]
+            obs_dict[self._camera_keys[name]] = images[name]
         obs_dict.update(tactile_obs)
         return obs_dict
 
@@ -1000,45 +1306,42 @@ class ManipulatorRobot:
                 "ManipulatorRobot is not connected. You need to run `robot.connect()`."
             )
 
-        from_idx = 0
-        to_idx = 0
         action_sent = []
-        for name in self.follower_arms:
+        for name, follower_slice in self._follower_slices.items():
             # Get goal position of each follower arm by splitting the action vector
-            to_idx += len(self.follower_arms[name].motor_names)
-            goal_pos = action[from_idx:to_idx]
-            from_idx = to_idx
+            goal_pos = action[follower_slice].numpy()
 
             # Cap goal position when too far away from present position.
             # Slower fps expected due to reading from the follower.
             if self.config.max_relative_target is not None:
                 present_pos = self.follower_arms[name].read("Present_Position")
-                present_pos = torch.from_numpy(present_pos)
-                goal_pos = ensure_safe_goal_position(goal_pos, present_pos, self.config.max_relative_target)
+                goal_pos = ensure_safe_goal_position_np(goal_pos, present_pos, self._max_relative_targets[name])
 
             # Save tensor to concat and return
-            action_sent.append(goal_pos)
+            action_sent.append(torch.from_numpy(goal_pos))
 
             # Send goal position to each follower
-            goal_pos = goal_pos.numpy().astype(np.float32)
-            self.follower_arms[name].write("Goal_Position", goal_pos)
-
+            self.follower_arms[name].write("Goal_Position", goal_pos.astype(np.float32, copy=False))
+
+        if self._only_follower is not None:
+            # Without clamping, the goal position is a view of `action`, so it is copied like `torch.cat` does to
+            # not alias the caller's tensor.
+            if self.config.max_relative_target is None:
+                return action_sent[0].clone()
+            return action_sent[0]
         return torch.cat(action_sent)
 
     def has_tactile_critical_errors(self) -> bool:
         """检查是否有触觉传感器发生关键错误"""
-        for name, sensor in self.tactile_sensors.items():
-            if hasattr(sensor, 'has_critical_error') and sensor.has_critical_error():
-                return True
-        return False
+        return any(has_critical_error() for _, has_critical_error, _ in self._tactile_error_checks)
     
     def get_tactile_error_summary(self) -> dict:
         """获取触觉传感器错误摘要"""
         errors = {}
-        for name, sensor in self.tactile_sensors.items():
-            if hasattr(sensor, 'has_critical_error') and sensor.has_critical_error():
-                if hasattr(sensor, 'get_error_status'):
-                    errors[name] = sensor.get_error_status()
+        for name, has_critical_error, get_error_status in self._tactile_error_checks:
+            if has_critical_error():
+                if get_error_status is not None:
+                    errors[name] = get_error_status()
                 else:
                     errors[name] = {"has_error": True, "error_message": "Critical error detected"}
         return errors
@@ -1083,6 +1386,11 @@ class ManipulatorRobot:
             except Exception as e:
                 print(f"Warning: Error disconnecting camera {name}: {e}")
 
+        # Stop streaming before the tactile sensors are disconnected
+        if self._tactile_streamer is not None:
+            self._tactile_streamer.stop()
+            self._tactile_streamer = None
+
         # Disconnect tactile sensors with extra care
         for name in self.tactile_sensors:
             try:
@@ -1112,17 +1420,7 @@ class ManipulatorRobot:
                         
                         # 查找并终止相关的ffmpeg进程
                         try:
-                            import subprocess
-                            result = subprocess.run(['pgrep', '-f', 'ffmpeg.*video'], 
-                                                  capture_output=True, text=True, timeout=2.0)
-                            if result.returncode == 0 and result.stdout.strip():
-                                pids = [pid.strip() for pid in result.stdout.strip().split('\n') if pid.strip()]
-                                for pid in pids:
-                                    try:
-                                        subprocess.run(['kill', '-9', pid], timeout=1.0)
-                                        print(f"强制终止ffmpeg进程 {pid}")
-                                    except:
-                                        pass
+                            _kill_ffmpeg_video_processes()
                         except:
                             pass
                     
@@ -1136,9 +1434,29 @@ class ManipulatorRobot:
                 except Exception as force_error:
                     print(f"Force cleanup failed for {name}: {force_error}")
 
+        self._shutdown_pools()
+        self._invalidate_features_cache()
+        self._flush_tactile_timings()
+
+        if self._original_cpu_affinity is not None:
+            os.sched_setaffinity(0, self._original_cpu_affinity)
+            self._original_cpu_affinity = None
+        self._tactile_error_checks = []
+
         self.is_connected = False
         print("ManipulatorRobot disconnected successfully.")
 
+    def _flush_tactile_timings(self):
+        """Log a summary of the recorded tactile read durations and clear them."""
+        if not self._tactile_read_dt_s:
+            return
+        dt_s = np.fromiter(self._tactile_read_dt_s, dtype=np.float64)
+        logging.info(
+            f"Tactile reads over the last {len(dt_s)} frames: mean {dt_s.mean() * 1000:.2f}ms, "
+            f"max {dt_s.max() * 1000:.2f}ms"
+        )
+        self._tactile_read_dt_s.clear()
+
     def __del__(self):
         """Destructor to ensure safe cleanup."""
         try:
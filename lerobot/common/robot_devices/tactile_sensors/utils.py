@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Protocol, Dict, Any, Optional
+import logging
+import threading
+import time
+from typing import Protocol, Dict, Any, Optional, Callable
 
 import numpy as np
 
@@ -88,6 +91,115 @@ class TactileSensor(Protocol):
         ...
 
 
+class TactileStreamer:
+    """
+    Continuously reads tactile sensors in background threads and keeps their latest processed frame.
+
+    Each sensor is polled by its own thread, which calls `sensor.read()` and then `process(name, data)` to
+    format the raw data (e.g. numpy to torch conversion). The result is stored in a per-sensor slot guarded
+    by a lock, so that `snapshot()` only has to merge ready-made entries. This decouples sensor polling and
+    formatting from the control loop.
+
+    Example:
+    ```python
+    streamer = TactileStreamer(sensors, process=lambda name, data: {name: data})
+    streamer.start()
+    latest = streamer.snapshot()
+    streamer.stop()
+    ```
+
+    Args:
+        sensors: Dictionary mapping sensor names to connected sensor instances
+        process: Callable formatting the data of a sensor into a dictionary. `data` is None when the
+            read or the formatting of the frame failed.
+        poll_interval_s: Time to wait between two reads of the same sensor (default: 0.005)
+        initializer: Optional callable run at the start of each polling thread, e.g. to set its CPU affinity
+        warning_interval_s: Minimum time between two warnings about failed reads of the same sensor
+            (default: 1.0)
+    """
+
+    def __init__(
+        self,
+        sensors: Dict[str, "TactileSensor"],
+        process: Callable[[str, Optional[Dict[str, Any]]], Dict[str, Any]],
+        poll_interval_s: float = 0.005,
+        initializer: Optional[Callable[[], None]] = None,
+        warning_interval_s: float = 1.0,
+    ):
+        self.sensors = sensors
+        self.process = process
+        self.poll_interval_s = poll_interval_s
+        self.initializer = initializer
+        self.warning_interval_s = warning_interval_s
+
+        self._latest = {}
+        self._locks = {name: threading.Lock() for name in sensors}
+        self._stop_event = threading.Event()
+        self._threads = []
+        # Time at which an error was last logged for each sensor, only accessed by its polling thread
+        self._last_warning_t = {}
+
+    def _warn(self, name: str, message: str):
+        # Sensors are polled every few milliseconds, so only log the errors of a sensor once per interval.
+        now = time.perf_counter()
+        if now - self._last_warning_t.get(name, float("-inf")) >= self.warning_interval_s:
+            self._last_warning_t[name] = now
+            logging.warning(message)
+
+    def _read_and_process(self, name: str) -> Dict[str, Any]:
+        try:
+            data = self.sensors[name].read()
+        except Exception as e:
+            self._warn(name, f"Error reading from tactile sensor {name}: {e}")
+            data = None
+
+        if data is not None:
+            try:
+                return self.process(name, data)
+            except Exception as e:
+                # Fallback to the default values of the sensor instead of stopping its polling thread, which
+                # would keep returning a stale frame.
+                self._warn(name, f"Error processing a frame of tactile sensor {name}: {e}")
+        return self.process(name, None)
+
+    def _loop(self, name: str):
+        if self.initializer is not None:
+            self.initializer()
+        while not self._stop_event.is_set():
+            processed = self._read_and_process(name)
+            with self._locks[name]:
+                self._latest[name] = processed
+            self._stop_event.wait(self.poll_interval_s)
+
+    def start(self):
+        """Read every sensor once so that `snapshot` is complete, then start the polling threads."""
+        for name in self.sensors:
+            self._latest[name] = self._read_and_process(name)
+
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._loop, args=(name,), name=f"tactile_stream_{name}", daemon=True)
+            for name in self.sensors
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the latest processed frame of all sensors merged into a single dictionary."""
+        merged = {}
+        for name, lock in self._locks.items():
+            with lock:
+                merged.update(self._latest[name])
+        return merged
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the polling threads."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+
 def make_tactile_sensors_from_configs(
     tactile_sensor_configs: Dict[str, TactileSensorConfig]
 ) -> Dict[str, TactileSensor]:
@@ -0,0 +1,195 @@
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the formatting of the tactile observations of a mocked Koch robot, with fake tactile sensors.
+
+Example of running a specific test:
+```bash
+pytest -sx tests/robots/test_manipulator_tactile.py::test_tactile_observation_keys
+```
+"""
+
+import warnings
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.common.robot_devices.robots import manipulator
+from lerobot.common.robot_devices.robots.utils import make_robot
+from lerobot.common.robot_devices.tactile_sensors.configs import DIGITConfig, GelSightConfig, Tac3DConfig
+from tests.utils import mock_calibration_dir
+
+
+def read_only(array):
+    # Like the arrays built by PyTac3D from the received bytes
+    return np.frombuffer(np.ascontiguousarray(array, dtype=np.float64).tobytes()).reshape(array.shape)
+
+
+class FakeTactileSensor:
+    def __init__(self, config, frames):
+        self.config = config
+        self.frames = frames
+        self.num_reads = 0
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def read(self):
+        frame = self.frames(self.num_reads)
+        self.num_reads += 1
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+
+
+def tac3d_frame(index):
+    rng = np.random.default_rng(index)
+    return {
+        "recvTimestamp": 10.0 + index,
+        "SN": "AD2",
+        "index": index,
+        "3D_Positions": read_only(rng.random((400, 3))),
+        "3D_Displacements": read_only(rng.random((400, 3))),
+        "3D_Forces": read_only(rng.random((400, 3))),
+        "resultant_force": rng.random((1, 3)),
+        "resultant_moment": rng.random(3),
+    }
+
+
+def digit_frame(index):
+    # The first frame, read on `connect`, has the right shape and the next ones a wrong one
+    shape = (240, 320, 3) if index == 0 else (120, 160, 3)
+    return {"tactile_image": np.full(shape, 7, dtype=np.uint8), "timestamp": 5.0, "frame_index": index}
+
+
+FAKE_SENSORS = {
+    "tac3d": (Tac3DConfig(port=1), tac3d_frame),
+    "tac3d_none": (Tac3DConfig(port=2), lambda index: None),
+    "tac3d_empty": (Tac3DConfig(port=3), lambda index: {}),
+    "unknown": (Tac3DConfig(port=4), lambda index: {"resultant_force": [1.0, 2.0, 3.0]}),
+    "digit": (DIGITConfig(), digit_frame),
+    "gelsight_failing": (GelSightConfig(imgh=24, imgw=32), lambda index: RuntimeError("unplugged")),
+}
+
+
+def make_fake_tactile_sensors(configs):
+    sensors = {}
+    for name, (config, frames) in FAKE_SENSORS.items():
+        # The type of a sensor is read from its config
+        config = SimpleNamespace(type="unknown") if name == "unknown" else config
+        sensors[name] = FakeTactileSensor(config, frames)
+    return sensors
+
+
+@pytest.fixture
+def robot(tmp_path, monkeypatch, patch_builtins_input):
+    monkeypatch.setattr(manipulator, "make_tactile_sensors_from_configs", make_fake_tactile_sensors)
+    calibration_dir = tmp_path / "koch"
+    mock_calibration_dir(calibration_dir)
+    robot = make_robot(
+        "koch",
+        mock=True,
+        calibration_dir=calibration_dir,
+        cameras={},
+        tactile_sensors={name: config for name, (config, _) in FAKE_SENSORS.items()},
+    )
+    robot.connect()
+    yield robot
+    robot.disconnect()
+
+
+def tactile_key(robot, name, field):
+    return getattr(robot._tactile_keys[name].obs, field)
+
+
+@pytest.mark.parametrize("as_torch", [True, False])
+def test_tactile_observation_keys(robot, as_torch):
+    observation = robot.capture_observation(as_torch=as_torch)
+
+    tactile_keys = {key for key in observation if key.startswith("observation.tactile.")}
+    assert tactile_keys == {key for key in robot.features if key.startswith("observation.tactile.")}
+
+    array_type = torch.Tensor if as_torch else np.ndarray
+    for key in tactile_keys:
+        if not key.endswith(".sensor_sn"):
+            assert isinstance(observation[key], array_type), key
+
+
+def test_tactile_read_only_tac3d_arrays(robot):
+    frame = tac3d_frame(robot.tactile_sensors["tac3d"].num_reads)
+
+    with warnings.catch_warnings():
+        # `torch.from_numpy` warns about read-only arrays
+        warnings.simplefilter("error")
+        observation = robot.capture_observation(as_torch=True)
+
+    for field, raw_field in [
+        ("positions_3d", "3D_Positions"),
+        ("displacements_3d", "3D_Displacements"),
+        ("forces_3d", "3D_Forces"),
+    ]:
+        tensor = observation[tactile_key(robot, "tac3d", field)]
+        assert tensor.dtype == torch.float64
+        np.testing.assert_array_equal(tensor.numpy(), frame[raw_field])
+
+    observation = robot.capture_observation(as_torch=False)
+    assert observation[tactile_key(robot, "tac3d", "positions_3d")].flags["WRITEABLE"]
+    assert observation[tactile_key(robot, "tac3d", "sensor_sn")] == "AD2"
+
+
+@pytest.mark.parametrize("name", ["tac3d_none", "tac3d_empty"])
+def test_tactile_missing_frame(robot, name):
+    observation = robot.capture_observation(as_torch=False)
+
+    # The same read-only defaults are shared by every frame
+    for field in ["positions_3d", "displacements_3d", "forces_3d"]:
+        array = observation[tactile_key(robot, name, field)]
+        assert array is manipulator._ZERO_400X3_F64
+    assert observation[tactile_key(robot, name, "resultant_force")] is manipulator._ZERO_3_F64
+    assert observation[tactile_key(robot, name, "sensor_sn")] == ""
+    assert observation[tactile_key(robot, name, "frame_index")] is manipulator._ZERO_1_I64
+
+
+def test_tactile_unknown_sensor_type(robot):
+    observation = robot.capture_observation(as_torch=False)
+
+    assert tactile_key(robot, "unknown", "sensor_sn").startswith("observation.tactile.unknown.")
+    assert observation[tactile_key(robot, "unknown", "sensor_sn")] == ""
+    np.testing.assert_array_equal(observation[tactile_key(robot, "unknown", "resultant_force")], np.zeros(3))
+    assert tactile_key(robot, "unknown", "positions_3d") not in observation
+
+
+def test_tactile_wrong_image_shape(robot):
+    observation = robot.capture_observation(as_torch=False)
+
+    # Images of a shape other than the one locked in on `connect` are replaced by a blank image
+    image = observation[tactile_key(robot, "digit", "tactile_image")]
+    assert image.shape == (240, 320, 3)
+    assert not image.any()
+    frame_index = observation[tactile_key(robot, "digit", "frame_index")]
+    assert frame_index[0] == robot.tactile_sensors["digit"].num_reads - 1
+
+
+def test_tactile_failing_read(robot):
+    observation = robot.capture_observation(as_torch=False)
+
+    image = observation[tactile_key(robot, "gelsight_failing", "tactile_image")]
+    assert image.shape == (24, 32, 3)
+    assert not image.any()
+    assert observation[tactile_key(robot, "gelsight_failing", "sensor_sn")] == ""
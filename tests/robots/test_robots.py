@@ -36,9 +36,15 @@ pytest -sx 'tests/test_robots.py::test_robot[aloha-True]'
 ```
 """
 
+import numpy as np
 import pytest
 import torch
 
+from lerobot.common.robot_devices.robots.manipulator import (
+    ensure_safe_goal_position,
+    ensure_safe_goal_position_np,
+    max_relative_target_array,
+)
 from lerobot.common.robot_devices.robots.utils import make_robot
 from lerobot.common.robot_devices.utils import RobotDeviceAlreadyConnectedError, RobotDeviceNotConnectedError
 from tests.utils import TEST_ROBOT_TYPES, mock_calibration_dir, require_robot
@@ -142,3 +148,50 @@ def test_robot(tmp_path, request, robot_type, mock):
         assert not robot.leader_arms[name].is_connected
     for name in robot.cameras:
         assert not robot.cameras[name].is_connected
+
+
+def test_ensure_safe_goal_position_np_clamps():
+    present_pos = np.array([0.0, 10.0, -10.0], dtype=np.float32)
+    goal_pos = np.array([20.0, 2.0, -10.5], dtype=np.float32)
+    max_relative_target = max_relative_target_array(5.0, len(goal_pos))
+
+    safe_goal_pos = ensure_safe_goal_position_np(goal_pos, present_pos, max_relative_target)
+
+    np.testing.assert_array_equal(safe_goal_pos, np.array([5.0, 5.0, -10.5], dtype=np.float32))
+    assert safe_goal_pos.dtype == np.float32
+    # The requested goal position is left untouched
+    np.testing.assert_array_equal(goal_pos, np.array([20.0, 2.0, -10.5], dtype=np.float32))
+
+
+def test_ensure_safe_goal_position_np_within_target():
+    present_pos = np.array([0.0, 10.0, -10.0], dtype=np.float32)
+    goal_pos = np.array([4.0, 6.0, -5.0], dtype=np.float32)
+
+    safe_goal_pos = ensure_safe_goal_position_np(goal_pos, present_pos, 5.0)
+
+    np.testing.assert_array_equal(safe_goal_pos, goal_pos)
+
+
+def test_ensure_safe_goal_position_np_per_motor_target():
+    present_pos = np.zeros(3, dtype=np.float32)
+    goal_pos = np.array([10.0, -10.0, 10.0], dtype=np.float32)
+    max_relative_target = [1.0, 2.0, 20.0]
+
+    safe_goal_pos = ensure_safe_goal_position_np(goal_pos, present_pos, max_relative_target)
+    np.testing.assert_array_equal(safe_goal_pos, np.array([1.0, -2.0, 10.0], dtype=np.float32))
+
+    # Same result with the array built once per follower arm in `connect`
+    safe_goal_pos = ensure_safe_goal_position_np(
+        goal_pos, present_pos, max_relative_target_array(max_relative_target, len(goal_pos))
+    )
+    np.testing.assert_array_equal(safe_goal_pos, np.array([1.0, -2.0, 10.0], dtype=np.float32))
+
+
+def test_ensure_safe_goal_position_tensor():
+    present_pos = torch.tensor([0.0, 10.0, -10.0])
+    goal_pos = torch.tensor([20.0, 2.0, -10.5])
+
+    safe_goal_pos = ensure_safe_goal_position(goal_pos, present_pos, [5.0, 5.0, 5.0])
+
+    assert isinstance(safe_goal_pos, torch.Tensor)
+    torch.testing.assert_close(safe_goal_pos, torch.tensor([5.0, 5.0, -10.5]))
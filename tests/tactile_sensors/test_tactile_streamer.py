@@ -0,0 +1,124 @@
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the background streaming of tactile sensor frames, with fake sensors.
+
+Example of running a specific test:
+```bash
+pytest -sx tests/tactile_sensors/test_tactile_streamer.py::test_streamer_start_snapshot_stop
+```
+"""
+
+import threading
+import time
+
+from lerobot.common.robot_devices.tactile_sensors.utils import TactileStreamer
+
+
+class FakeTactileSensor:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.num_reads = 0
+        self.lock = threading.Lock()
+
+    def read(self):
+        with self.lock:
+            self.num_reads += 1
+            index = self.num_reads
+        if self.fail:
+            raise RuntimeError("sensor unplugged")
+        return {"index": index}
+
+
+def process(name, data):
+    return {f"{name}.index": None if data is None else data["index"]}
+
+
+def wait_for(condition, timeout_s=2.0):
+    start = time.perf_counter()
+    while not condition():
+        assert time.perf_counter() - start < timeout_s, "Timed out waiting for the streamer"
+        time.sleep(0.005)
+
+
+def test_streamer_start_snapshot_stop():
+    sensors = {"left": FakeTactileSensor(), "right": FakeTactileSensor()}
+    streamer = TactileStreamer(sensors, process, poll_interval_s=0.001)
+
+    streamer.start()
+    try:
+        # Every sensor is read once by `start`, so the snapshot is complete right away
+        snapshot = streamer.snapshot()
+        assert set(snapshot) == {"left.index", "right.index"}
+        assert all(index >= 1 for index in snapshot.values())
+
+        # The polling threads keep the snapshot up to date
+        wait_for(lambda: streamer.snapshot()["left.index"] > snapshot["left.index"])
+    finally:
+        streamer.stop()
+
+    stream_threads = [thread for thread in threading.enumerate() if thread.name.startswith("tactile_stream")]
+    assert not any(thread.is_alive() for thread in stream_threads)
+    num_reads = sensors["left"].num_reads
+    time.sleep(0.05)
+    assert sensors["left"].num_reads == num_reads
+
+
+def test_streamer_failing_read(caplog):
+    sensors = {"ok": FakeTactileSensor(), "dead": FakeTactileSensor(fail=True)}
+    streamer = TactileStreamer(sensors, process, poll_interval_s=0.001, warning_interval_s=60.0)
+
+    streamer.start()
+    try:
+        snapshot = streamer.snapshot()
+        # A failed read is processed as missing data, without affecting the other sensors
+        assert snapshot["dead.index"] is None
+        assert snapshot["ok.index"] >= 1
+
+        wait_for(lambda: sensors["dead"].num_reads > 3)
+    finally:
+        streamer.stop()
+
+    # The errors of a sensor polled in a loop are rate limited
+    warnings = [record for record in caplog.records if "dead" in record.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_streamer_failing_process(caplog):
+    sensors = {"ok": FakeTactileSensor(), "bad": FakeTactileSensor()}
+
+    def process_failing_from_3rd_frame(name, data):
+        if name == "bad" and data is not None and data["index"] >= 3:
+            raise ValueError("malformed frame")
+        return process(name, data)
+
+    streamer = TactileStreamer(
+        sensors, process_failing_from_3rd_frame, poll_interval_s=0.001, warning_interval_s=60.0
+    )
+
+    streamer.start()
+    try:
+        # The polling thread survives the malformed frames and falls back to the default values, instead of
+        # keeping the last valid frame
+        wait_for(lambda: sensors["bad"].num_reads > 5)
+        assert streamer.snapshot()["bad.index"] is None
+        assert all(thread.is_alive() for thread in streamer._threads)
+
+        ok_index = streamer.snapshot()["ok.index"]
+        wait_for(lambda: streamer.snapshot()["ok.index"] > ok_index)
+    finally:
+        streamer.stop()
+
+    warnings = [record for record in caplog.records if "bad" in record.getMessage()]
+    assert len(warnings) == 1